@@ -39,6 +39,67 @@ FUNCTIONS_UI = [0, 0, 1]
 FORCES_UI = [[True, False, True],    # Forces
              [True, True, True, ]]   # Force coefficients
 
+# Object properties: (name, default, type, group, description)
+PROPERTY_SPEC = (
+    # Setup and utility
+    ('ReportingFunctionType', OBJECT_NAMES, "App::PropertyEnumeration", "",
+     "Type of reporting function"),
+    ('Patch', None, "App::PropertyLinkGlobal", "Function object",
+     "Patch on which to create the function object"),
+
+    # Forces
+    ('ReferenceDensity', '1 kg/m^3', "App::PropertyQuantity", "Forces",
+     "Reference density"),
+    ('ReferencePressure', '0 Pa', "App::PropertyPressure", "Forces",
+     "Reference pressure"),
+    ('CentreOfRotation', FreeCAD.Vector(0, 0, 0), "App::PropertyPosition", "Forces",
+     "Centre of rotation"),
+    ('WriteFields', False, "App::PropertyBool", "Forces",
+     "Whether to write output fields"),
+
+    # Force coefficients
+    ('Lift', FreeCAD.Vector(1, 0, 0), "App::PropertyVector", "Force coefficients",
+     "Lift direction (x component)"),
+    ('Drag', FreeCAD.Vector(0, 1, 0), "App::PropertyVector", "Force coefficients",
+     "Drag direction"),
+    ('MagnitudeUInf', '1 m/s', "App::PropertyQuantity", "Force coefficients",
+     "Freestream velocity magnitude"),
+    ('LengthRef', '1 m', "App::PropertyQuantity", "Force coefficients",
+     "Coefficient length reference"),
+    ('AreaRef', '1 m^2', "App::PropertyQuantity", "Force coefficients",
+     "Coefficient area reference"),
+
+    # Spatial binning
+    ('NBins', 0, "App::PropertyInteger", "Forces",
+     "Number of bins"),
+    ('Direction', FreeCAD.Vector(1, 0, 0), "App::PropertyVector", "Forces",
+     "Binning direction"),
+    ('Cumulative', True, "App::PropertyBool", "Forces",
+     "Cumulative"),
+
+    # Probes
+    ('SampleFieldName', "p", "App::PropertyString", "Probes",
+     "Name of the field to sample"),
+    ('ProbePosition', FreeCAD.Vector(0, 0, 0), "App::PropertyPosition", "Probes",
+     "Location of the probe sample location"),
+)
+
+# Properties which addObjectProperty must re-apply after loading (quantity units are lost, and
+# enumeration values may have been extended)
+RESTORE_PROPERTY_SPEC = tuple(spec for spec in PROPERTY_SPEC
+                              if spec[2] in ("App::PropertyQuantity", "App::PropertyEnumeration"))
+
+# Resources are queried repeatedly by the GUI, so evaluate them once
+ICON_PATH = os.path.join(CfdTools.getModulePath(), "Gui", "Icons", "monitor.svg")
+COMMAND_RESOURCES = {'Pixmap': ICON_PATH,
+                     'MenuText': QtCore.QT_TRANSLATE_NOOP("Cfd_ReportingFunctions",
+                                                          "Reporting function"),
+                     'ToolTip': QtCore.QT_TRANSLATE_NOOP("Cfd_ReportingFunctions",
+                                                         "Create a reporting function for the current case")}
+
+# View properties whose change requires boolean fragments to be reset to compSolid mode
+COMP_SOLID_PROPERTIES = frozenset({'Visibility', 'DisplayMode'})
+
 
 def makeCfdReportingFunction(name="ReportingFunction"):
     obj = FreeCAD.ActiveDocument.addObject("Part::FeaturePython", name)
@@ -50,12 +111,7 @@ def makeCfdReportingFunction(name="ReportingFunction"):
 
 class CommandCfdReportingFunction:
     def GetResources(self):
-        icon_path = os.path.join(CfdTools.getModulePath(), "Gui", "Icons", "monitor.svg")
-        return {'Pixmap': icon_path,
-                'MenuText': QtCore.QT_TRANSLATE_NOOP("Cfd_ReportingFunctions",
-                                                     "Reporting function"),
-                'ToolTip': QtCore.QT_TRANSLATE_NOOP("Cfd_ReportingFunctions",
-                                                    "Create a reporting function for the current case")}
+        return COMMAND_RESOURCES
 
     def IsActive(self):
         return CfdTools.getActiveAnalysis() is not None     # Same as for boundary condition commands
@@ -74,60 +130,26 @@ class CfdReportingFunction:
     def __init__(self, obj):
         self.Type = "ReportingFunction"
         self.Object = obj
+        self.loading = False
         obj.Proxy = self
         self.initProperties(obj)
 
-    def initProperties(self, obj):
-
-        # Setup and utility
-        addObjectProperty(obj, 'ReportingFunctionType', OBJECT_NAMES, "App::PropertyEnumeration", "",
-                          "Type of reporting function")
-
-        addObjectProperty(obj, 'Patch', None, "App::PropertyLinkGlobal", "Function object",
-                          "Patch on which to create the function object")
-
-        # Forces
-        addObjectProperty(obj, 'ReferenceDensity', '1 kg/m^3', "App::PropertyQuantity", "Forces",
-                          "Reference density")
-        addObjectProperty(obj, 'ReferencePressure', '0 Pa', "App::PropertyPressure", "Forces",
-                          "Reference pressure")
-        addObjectProperty(obj, 'CentreOfRotation', FreeCAD.Vector(0, 0, 0), "App::PropertyPosition", "Forces",
-                          "Centre of rotation")
-        addObjectProperty(obj, 'WriteFields', False, "App::PropertyBool", "Forces",
-                          "Whether to write output fields")
-
-        # Force coefficients
-        addObjectProperty(obj, 'Lift', FreeCAD.Vector(1, 0, 0), "App::PropertyVector", "Force coefficients",
-                          "Lift direction (x component)")
-
-        addObjectProperty(obj, 'Drag', FreeCAD.Vector(0, 1, 0), "App::PropertyVector", "Force coefficients",
-                          "Drag direction")
-
-        addObjectProperty(obj, 'MagnitudeUInf', '1 m/s', "App::PropertyQuantity", "Force coefficients",
-                          "Freestream velocity magnitude")
-        addObjectProperty(obj, 'LengthRef', '1 m', "App::PropertyQuantity", "Force coefficients",
-                          "Coefficient length reference")
-        addObjectProperty(obj, 'AreaRef', '1 m^2', "App::PropertyQuantity", "Force coefficients",
-                          "Coefficient area reference")
-
-        # Spatial binning
-        addObjectProperty(obj, 'NBins', 0, "App::PropertyInteger", "Forces",
-                          "Number of bins")
-        addObjectProperty(obj, 'Direction', FreeCAD.Vector(1, 0, 0), "App::PropertyVector", "Forces",
-                          "Binning direction")
-        addObjectProperty(obj, 'Cumulative', True, "App::PropertyBool", "Forces",
-                          "Cumulative")
-
-        # Probes
-        addObjectProperty(obj, 'SampleFieldName', "p", "App::PropertyString", "Probes",
-                          "Name of the field to sample")
-
-        addObjectProperty(obj, 'ProbePosition', FreeCAD.Vector(0, 0, 0), "App::PropertyPosition", "Probes",
-                          "Location of the probe sample location")
-
+    def initProperties(self, obj, specs=PROPERTY_SPEC):
+        # Set while adding properties so that the view provider ignores the resulting change notifications
+        self.loading = True
+        try:
+            for name, default, prop_type, group, doc in specs:
+                addObjectProperty(obj, name, default, prop_type, group, doc)
+        finally:
+            self.loading = False
 
     def onDocumentRestored(self, obj):
-        self.initProperties(obj)
+        existing = set(obj.PropertiesList)
+        if all(spec[0] in existing for spec in PROPERTY_SPEC):
+            # Already fully initialised; only re-apply what gets lost or may have changed on load
+            self.initProperties(obj, RESTORE_PROPERTY_SPEC)
+        else:
+            self.initProperties(obj)
 
     def execute(self, obj):
         pass
@@ -160,8 +182,7 @@ class ViewProviderCfdReportingFunction:
         self.taskd = None
 
     def getIcon(self):
-        icon_path = os.path.join(CfdTools.getModulePath(), "Gui", "Icons", "monitor.svg")
-        return icon_path
+        return ICON_PATH
 
     def attach(self, vobj):
         self.ViewObject = vobj
@@ -182,12 +203,15 @@ class ViewProviderCfdReportingFunction:
         return mode
 
     def updateData(self, obj, prop):
+        if getattr(obj.Proxy, 'loading', False):
+            return
         analysis_obj = CfdTools.getParentAnalysisObject(obj)
         if analysis_obj and not analysis_obj.Proxy.loading:
             analysis_obj.NeedsCaseRewrite = True
 
     def onChanged(self, vobj, prop):
-        CfdTools.setCompSolid(vobj)
+        if prop in COMP_SOLID_PROPERTIES:
+            CfdTools.setCompSolid(vobj)
         return
 
     def doubleClicked(self, vobj):
@@ -206,8 +230,6 @@ class ViewProviderCfdReportingFunction:
             return False
 
         from CfdOF.PostProcess import TaskPanelCfdReportingFunction
-        import importlib
-        importlib.reload(TaskPanelCfdReportingFunction)
         taskd = TaskPanelCfdReportingFunction.TaskPanelCfdReportingFunction(self.Object)
         self.Object.ViewObject.show()
         taskd.obj = vobj.Object